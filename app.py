@@ -1,7 +1,11 @@
 import streamlit as st
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+from urllib.parse import urlsplit, urlunsplit
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 import re
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
@@ -13,148 +17,410 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Configure caching
-@st.cache_data(ttl=3600)  # Cache for 1 hour
-def fetch_website(url):
-    """Fetch website content with retries and caching."""
+# Prefer the C-backed lxml parser when available; html.parser is pure Python
+# and dominates CPU time on real-world pages.
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Shared session, created once at import. Reusing the connection pool keeps
+# keep-alive sockets (and their TLS handshakes) warm across requests instead
+# of rebuilding session, adapter and headers on every fetch.
+def _build_session():
     retry_strategy = Retry(
         total=3,
         backoff_factor=1,
         status_forcelist=[500, 502, 503, 504]
     )
-    
+
     session = requests.Session()
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=50,
+        pool_maxsize=50
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
-    
-    headers = {
+
+    session.headers.update({
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',  # br decoded via the brotli package
         'Accept-Language': 'en-US,en;q=0.5'
-    }
-    
+    })
+
+    return session
+
+SESSION = _build_session()
+
+# Everything the signatures look at (meta/generator, script src, link href)
+# lives in <head> or early <body>, so reading at most this much bounds
+# bandwidth and parse time on multi-MB pages without losing detections.
+MAX_BODY_BYTES = 256 * 1024
+
+# Lightweight stand-in for requests.Response: the streamed body is consumed
+# during the capped read, and this pickles cleanly for st.cache_data.
+# The body stays as bytes — both the parser and the raw scan consume bytes,
+# so no full-body decode ever happens.
+FetchedPage = namedtuple('FetchedPage', ['content', 'headers'])
+
+# Validator cache for conditional GETs: url -> (etag, last_modified, page).
+# st.cache_data is the first tier; once its TTL lapses we revalidate with
+# If-None-Match/If-Modified-Since, and a 304 skips the body transfer.
+_REVALIDATION_CACHE = {}
+_REVALIDATION_CACHE_MAX = 256
+
+# Configure caching
+@st.cache_data(ttl=3600)  # Cache for 1 hour
+def fetch_website(url):
+    """Fetch website content with retries and caching."""
     try:
-        response = session.get(url, headers=headers, timeout=10)
+        cached = _REVALIDATION_CACHE.get(url)
+        conditional_headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                conditional_headers['If-None-Match'] = etag
+            if last_modified:
+                conditional_headers['If-Modified-Since'] = last_modified
+
+        response = SESSION.get(url, timeout=10, stream=True,
+                               headers=conditional_headers)
+        if cached and response.status_code == 304:
+            response.close()
+            return cached[2]
         response.raise_for_status()
-        return response
+
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=65536):
+            buf.extend(chunk)
+            if len(buf) >= MAX_BODY_BYTES:
+                break
+        response.close()
+
+        page = FetchedPage(content=bytes(buf), headers=response.headers)
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            if len(_REVALIDATION_CACHE) >= _REVALIDATION_CACHE_MAX:
+                _REVALIDATION_CACHE.clear()
+            _REVALIDATION_CACHE[url] = (etag, last_modified, page)
+
+        return page
     except requests.exceptions.RequestException as e:
         logger.error(f"Error fetching {url}: {str(e)}")
         raise e
 
+@lru_cache(maxsize=1024)  # Re-validated on every keystroke-driven rerun
 def clean_url(url):
     """Normalize and validate URL format."""
     if not url:
         return None
-        
+
     url = url.strip()
-    
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
-    url = url.rstrip('/')
-    
+
+    # One parse handles scheme defaulting, trailing-slash trimming (on the
+    # path only, so queries survive) and fragment removal in a single pass.
+    parts = urlsplit(url if '://' in url else 'https://' + url)
+    url = urlunsplit((parts.scheme, parts.netloc, parts.path.rstrip('/'),
+                      parts.query, ''))
+
     if not validators.url(url):
         return None
-        
+
     return url
 
+# Patterns shared by more than one signature below; compile each once and
+# reuse the Pattern object instead of compiling near-duplicates.
+WORDPRESS_RE = re.compile('WordPress', re.I)
+WP_ASSETS_RE = re.compile(r'wp-(?:includes|content)', re.I)
+SHOPIFY_RE = re.compile('shopify', re.I)
+WIXSTATIC_RE = re.compile('wixstatic.com', re.I)
+DRUPAL_FILES_RE = re.compile('sites/default/files', re.I)
+SQUARESPACE_CDN_RE = re.compile('static1.squarespace.com', re.I)
+JOOMLA_MEDIA_RE = re.compile(r'/media/(?:jui|system/js)/', re.I)
+
+# Platform signatures, built once at import time. Streamlit reruns the script
+# on every widget interaction, so rebuilding this dict (and re-running every
+# re.compile) per request would be pure waste.
+PLATFORM_SIGNATURES = {
+    'WordPress': (
+        ('meta', {'name': 'generator', 'content': WORDPRESS_RE}),
+        ('link', {'rel': 'pingback'}),
+        ('script', {'src': WP_ASSETS_RE}),
+        ('link', {'href': WP_ASSETS_RE}),
+        ('meta', {'name': 'description', 'content': WORDPRESS_RE})
+    ),
+    'Shopify': (
+        ('meta', {'content': re.compile('Shopify', re.I)}),
+        ('link', {'href': re.compile('cdn.shopify.com', re.I)}),
+        ('script', {'src': SHOPIFY_RE}),
+        ('div', {'class': SHOPIFY_RE})
+    ),
+    'Wix': (
+        ('meta', {'name': 'generator', 'content': re.compile('Wix.com', re.I)}),
+        ('script', {'src': WIXSTATIC_RE}),
+        ('img', {'src': WIXSTATIC_RE})
+    ),
+    'Drupal': (
+        ('meta', {'name': 'generator', 'content': re.compile('Drupal', re.I)}),
+        ('link', {'href': DRUPAL_FILES_RE}),
+        ('script', {'src': DRUPAL_FILES_RE})
+    ),
+    'Joomla': (
+        ('meta', {'name': 'generator', 'content': re.compile('Joomla', re.I)}),
+        ('script', {'src': JOOMLA_MEDIA_RE})
+    ),
+    'Ghost': (
+        ('meta', {'name': 'generator', 'content': re.compile('Ghost', re.I)}),
+        ('link', {'href': re.compile('ghost.io', re.I)})
+    ),
+    'Webflow': (
+        ('meta', {'name': 'generator', 'content': re.compile('Webflow', re.I)}),
+        ('html', {'class': re.compile('w-mod-js', re.I)})
+    ),
+    'Squarespace': (
+        ('meta', {'name': 'generator', 'content': re.compile('Squarespace', re.I)}),
+        ('script', {'src': SQUARESPACE_CDN_RE}),
+        ('img', {'src': SQUARESPACE_CDN_RE})
+    ),
+    'React': (
+        ('div', {'id': 'root'}),
+        ('div', {'id': 'app'}),
+        ('script', {'src': re.compile('react', re.I)})
+    ),
+    'Angular': (
+        ('script', {'src': re.compile('angular', re.I)}),
+        ('app-root', {}),
+        ('ng-version', {})
+    ),
+    'Vue.js': (
+        ('div', {'id': 'app'}),
+        ('script', {'src': re.compile('vue', re.I)}),
+        ('div', {'data-v-': re.compile(r'.*')})
+    )
+}
+
 def get_platform_signatures():
     """Return dictionary of platform signatures to look for."""
-    return {
-        'WordPress': [
-            ('meta', {'name': 'generator', 'content': re.compile('WordPress', re.I)}),
-            ('link', {'rel': 'pingback'}),
-            ('script', {'src': re.compile('wp-includes|wp-content', re.I)}),
-            ('link', {'href': re.compile('wp-content|wp-includes', re.I)}),
-            ('meta', {'name': 'description', 'content': re.compile('WordPress', re.I)})
-        ],
-        'Shopify': [
-            ('meta', {'content': re.compile('Shopify', re.I)}),
-            ('link', {'href': re.compile('cdn.shopify.com', re.I)}),
-            ('script', {'src': re.compile('shopify', re.I)}),
-            ('div', {'class': re.compile('shopify', re.I)})
-        ],
-        'Wix': [
-            ('meta', {'name': 'generator', 'content': re.compile('Wix.com', re.I)}),
-            ('script', {'src': re.compile('static.wixstatic.com', re.I)}),
-            ('img', {'src': re.compile('wixstatic.com', re.I)})
-        ],
-        'Drupal': [
-            ('meta', {'name': 'generator', 'content': re.compile('Drupal', re.I)}),
-            ('link', {'href': re.compile('sites/default/files', re.I)}),
-            ('script', {'src': re.compile('sites/default/files', re.I)})
-        ],
-        'Joomla': [
-            ('meta', {'name': 'generator', 'content': re.compile('Joomla', re.I)}),
-            ('script', {'src': re.compile('/media/jui/', re.I)}),
-            ('script', {'src': re.compile('/media/system/js/', re.I)})
-        ],
-        'Ghost': [
-            ('meta', {'name': 'generator', 'content': re.compile('Ghost', re.I)}),
-            ('link', {'href': re.compile('ghost.io', re.I)})
-        ],
-        'Webflow': [
-            ('meta', {'name': 'generator', 'content': re.compile('Webflow', re.I)}),
-            ('html', {'class': re.compile('w-mod-js', re.I)})
-        ],
-        'Squarespace': [
-            ('meta', {'name': 'generator', 'content': re.compile('Squarespace', re.I)}),
-            ('script', {'src': re.compile('static1.squarespace.com', re.I)}),
-            ('img', {'src': re.compile('static1.squarespace.com', re.I)})
-        ],
-        'React': [
-            ('div', {'id': 'root'}),
-            ('div', {'id': 'app'}),
-            ('script', {'src': re.compile('react', re.I)})
-        ],
-        'Angular': [
-            ('script', {'src': re.compile('angular', re.I)}),
-            ('app-root', {}),
-            ('ng-version', {})
-        ],
-        'Vue.js': [
-            ('div', {'id': 'app'}),
-            ('script', {'src': re.compile('vue', re.I)}),
-            ('div', {'data-v-': re.compile(r'.*')})
-        ]
-    }
+    return PLATFORM_SIGNATURES
+
+# Tag names the signatures inspect, used to bucket the DOM in a single pass.
+SIGNATURE_TAGS = sorted({tag for checks in PLATFORM_SIGNATURES.values()
+                         for tag, _ in checks})
+
+# Materialize only the tags the signatures look at; everything else
+# (tables, paragraphs, SVG, comments) is discarded at parse time. <html>
+# must not go through the strainer — matching the root would keep the whole
+# document — so its opening tag is read separately via HTML_TAG_RE.
+STRAINER = SoupStrainer([tag for tag in SIGNATURE_TAGS if tag != 'html'])
+
+HTML_TAG_RE = re.compile(rb'<html\b[^>]*>', re.I)
+
+def _group_name(platform):
+    """Turn a platform name into a valid regex group name (e.g. Vue.js)."""
+    return re.sub(r'\W', '_', platform)
+
+GROUP_PLATFORMS = {_group_name(name): name for name in PLATFORM_SIGNATURES}
+
+# Checks that are a lone regex on a src/href attribute are folded into one
+# alternation per (tag, attribute): each element's value is then scanned once
+# for every platform instead of once per platform.
+def _build_combined_attr_patterns():
+    combined = {}
+    for tag, attr in (('script', 'src'), ('link', 'href'), ('img', 'src')):
+        parts = []
+        for platform, checks in PLATFORM_SIGNATURES.items():
+            for check_tag, attrs in checks:
+                if (check_tag == tag and len(attrs) == 1
+                        and hasattr(attrs.get(attr), 'search')):
+                    parts.append(f'(?P<{_group_name(platform)}>{attrs[attr].pattern})')
+        if parts:
+            combined[(tag, attr)] = re.compile('|'.join(parts), re.I)
+    return combined
+
+COMBINED_ATTR_PATTERNS = _build_combined_attr_patterns()
+
+def count_combined_attr_hits(elements_by_tag):
+    """Count matching elements per platform src/href signature, one scan per blob.
+
+    All values for an attribute are joined once so each combined alternation
+    runs a single search over one string instead of one search per element.
+    The counts feed an element-level corroboration bonus, so repeat matches
+    inside one value (e.g. 'shopify' twice in a Shopify CDN URL) must still
+    count as a single hit: each match is attributed back to its source value
+    and values are deduplicated.
+    """
+    matched_values = {}
+    for (tag, attr), pattern in COMBINED_ATTR_PATTERNS.items():
+        blob = '\n'.join(element.get(attr) or ''
+                         for element in elements_by_tag.get(tag, ()))
+        if not blob:
+            continue
+        for match in pattern.finditer(blob):
+            key = (GROUP_PLATFORMS[match.lastgroup], tag, attr)
+            # No pattern can match across the '\n' separators, so the number
+            # of newlines before the match identifies the source value.
+            value_index = blob.count('\n', 0, match.start())
+            matched_values.setdefault(key, set()).add(value_index)
+    return {key: len(values) for key, values in matched_values.items()}
+
+def element_matches(element, attrs):
+    """Check one element against a signature's attribute tests.
+
+    Missing attributes and literal mismatches reject the element before any
+    regex runs, so e.g. meta tags without name="generator" never reach the
+    content pattern.
+    """
+    pattern_tests = []
+    for key, expected in attrs.items():
+        value = element.get(key)
+        if value is None:
+            return False
+        if isinstance(value, list):  # multi-valued attributes like class/rel
+            value = ' '.join(value)
+        if hasattr(expected, 'search'):
+            pattern_tests.append((expected, value))
+        elif value != expected:
+            return False
+
+    return all(pattern.search(value) for pattern, value in pattern_tests)
+
+# Almost every signature above boils down to a distinctive substring that
+# appears verbatim in the raw markup (URLs, generator names, class/rel
+# values). One combined alternation scans the page in a single pass and
+# tells us which platforms could possibly match, so the DOM checks can be
+# skipped entirely for the rest. These patterns are deliberately broad and
+# feed only that prefilter, where a false positive just means one
+# platform's DOM checks run unnecessarily. They never decide a result on
+# their own — anything decisive lives in _FASTPATH_PATTERNS below, which
+# holds itself to a much stricter precision bar.
+_RAW_PATTERNS = {
+    'WordPress': r'wordpress|wp-(?:includes|content)|pingback',
+    'Shopify': r'shopify',
+    'Wix': r'wix',
+    'Drupal': r'drupal|sites/default/files',
+    'Joomla': r'joomla|/media/jui/|/media/system/js/',
+    'Ghost': r'ghost',
+    'Webflow': r'webflow|w-mod-js',
+    'Squarespace': r'squarespace',
+    'React': r'react',
+    'Angular': r'angular|app-root|ng-version',
+    'Vue.js': r'vue|data-v-'
+}
+
+# Compiled as a bytes pattern: the signature markers are all ASCII, so the
+# scan runs straight over the fetched body without decoding it first.
+RAW_SIGNATURE_RE = re.compile(
+    '|'.join(f'(?P<{_group_name(name)}>{pattern})'
+             for name, pattern in _RAW_PATTERNS.items()).encode('ascii'),
+    re.I
+)
+
+# High-precision markers for the decisive fast path: context-free substrings
+# that only occur in platform-generated markup (asset paths, CDN hosts,
+# framework attributes), never in prose. A hit here can skip the DOM parse
+# outright, so nothing word-like ('wordpress', 'angular', ...) belongs in
+# this set — a dev-blog article about a framework must not match.
+_FASTPATH_PATTERNS = {
+    'WordPress': r'wp-(?:includes|content)',
+    'Shopify': r'cdn\.shopify\.com',
+    'Wix': r'wixstatic\.com',
+    'Drupal': r'sites/default/files',
+    'Joomla': r'/media/(?:jui|system/js)/',
+    'Webflow': r'w-mod-js',
+    'Squarespace': r'static1\.squarespace\.com',
+    'Angular': r'ng-version',
+    'Vue.js': r'data-v-'
+}
+
+FASTPATH_SIGNATURE_RE = re.compile(
+    '|'.join(f'(?P<{_group_name(name)}>{pattern})'
+             for name, pattern in _FASTPATH_PATTERNS.items()).encode('ascii'),
+    re.I
+)
+
+# Platforms whose signatures rely on generic element structure (div ids,
+# attribute presence) that the raw substring scan cannot rule out.
+STRUCTURAL_PLATFORMS = {'React', 'Angular', 'Vue.js'}
+
+def scan_raw_signatures(content, pattern=RAW_SIGNATURE_RE):
+    """Collect distinct signature markers per platform in one pass over the
+    raw HTML bytes (e.g. both b'wp-includes' and b'wp-content' count as two
+    markers)."""
+    hits = {}
+    for match in pattern.finditer(content):
+        platform = GROUP_PLATFORMS[match.lastgroup]
+        hits.setdefault(platform, set()).add(match.group().lower())
+    return hits
+
+# A <meta name="generator"> naming one of these is effectively authoritative,
+# so the full signature sweep can be skipped when it is present.
+GENERATOR_PLATFORMS = {
+    'wordpress': 'WordPress',
+    'shopify': 'Shopify',
+    'wix': 'Wix',
+    'drupal': 'Drupal',
+    'joomla': 'Joomla',
+    'ghost': 'Ghost',
+    'webflow': 'Webflow',
+    'squarespace': 'Squarespace'
+}
+
+# Two or more distinct markers identify a platform well enough that building
+# a DOM would only confirm it, and parsing is the largest CPU cost per page.
+RAW_FASTPATH_THRESHOLD = 2
 
 def analyze_headers(headers):
     """Analyze response headers for platform hints."""
     header_scores = {}
-    
-    # Convert headers to lowercase for case-insensitive matching
-    headers = {k.lower(): v.lower() for k, v in headers.items()}
-    
-    # Server software
-    if 'server' in headers:
-        server = headers['server']
-        if 'apache' in server:
-            header_scores['Apache'] = 100
-        if 'nginx' in server:
-            header_scores['Nginx'] = 100
-        if 'microsoft-iis' in server:
-            header_scores['IIS'] = 100
-            
-    # Technology indicators
-    if 'x-powered-by' in headers:
-        powered_by = headers['x-powered-by']
-        if 'php' in powered_by:
-            header_scores['PHP'] = 100
-        if 'asp.net' in powered_by:
-            header_scores['ASP.NET'] = 100
-        if 'nodejs' in powered_by:
-            header_scores['Node.js'] = 100
-            
-    # Platform-specific headers
-    if any('x-shopify' in key for key in headers.keys()):
-        header_scores['Shopify'] = 100
-    if any('x-drupal' in key for key in headers.keys()):
-        header_scores['Drupal'] = 100
-    if any('x-wordpress' in key for key in headers.keys()):
-        header_scores['WordPress'] = 100
-        
+
+    # One pass over the raw headers; only the few values we inspect get
+    # lowercased, instead of rebuilding the whole dict per request.
+    for key, value in headers.items():
+        key = key.lower()
+
+        # Server software
+        if key == 'server':
+            server = value.lower()
+            if 'apache' in server:
+                header_scores['Apache'] = 100
+            if 'nginx' in server:
+                header_scores['Nginx'] = 100
+            if 'microsoft-iis' in server:
+                header_scores['IIS'] = 100
+
+        # Technology indicators
+        elif key == 'x-powered-by':
+            powered_by = value.lower()
+            if 'php' in powered_by:
+                header_scores['PHP'] = 100
+            if 'asp.net' in powered_by:
+                header_scores['ASP.NET'] = 100
+            if 'nodejs' in powered_by:
+                header_scores['Node.js'] = 100
+
+        # Platform session cookies are another cheap, high-confidence hint
+        elif key == 'set-cookie':
+            cookies = value.lower()
+            if 'wordpress_' in cookies or 'wp-settings' in cookies:
+                header_scores['WordPress'] = 100
+            if '_shopify_' in cookies:
+                header_scores['Shopify'] = 100
+            if 'wixsession' in cookies or 'svsession' in cookies:
+                header_scores['Wix'] = 100
+
+        # Platform-specific vendor headers
+        elif key.startswith('x-shopify'):
+            header_scores['Shopify'] = 100
+        elif key.startswith('x-drupal'):
+            header_scores['Drupal'] = 100
+        elif key.startswith('x-wordpress'):
+            header_scores['WordPress'] = 100
+
     return header_scores
 
 def get_confidence_score(matches, total_checks, header_matches=0):
@@ -163,54 +429,151 @@ def get_confidence_score(matches, total_checks, header_matches=0):
     header_bonus = min(20, header_matches * 10)  # Cap header bonus at 20%
     return min(100, base_score + header_bonus)
 
-def detect_platform(url):
-    """Detect the platform/framework used by a website."""
-    try:
-        response = fetch_website(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        header_scores = analyze_headers(response.headers)
+# Full analyses persist to disk so a server restart doesn't throw away the
+# results; 24h is fresh enough for "what platform is this site" answers.
+@st.cache_data(ttl=24 * 3600, max_entries=1024, persist='disk')
+def analyze_website(url):
+    """Fetch a website and score platform signatures against it.
+
+    Raises requests.exceptions.RequestException on fetch failure, which
+    also keeps failed lookups out of the cache.
+    """
+    response = fetch_website(url)
+
+    header_scores = analyze_headers(response.headers)
+
+    # When the high-precision scan finds several distinct markers for a
+    # platform, the DOM checks could only confirm it — skip the parse (the
+    # largest CPU cost per page) and rank straight from the scan. Only
+    # _FASTPATH_PATTERNS feed this decision; the broad word-level patterns
+    # are never allowed to produce an answer on their own.
+    fastpath_hits = scan_raw_signatures(response.content, FASTPATH_SIGNATURE_RE)
+    if any(len(markers) >= RAW_FASTPATH_THRESHOLD for markers in fastpath_hits.values()):
         detected_platforms = []
+        for platform, markers in fastpath_hits.items():
+            if len(markers) < RAW_FASTPATH_THRESHOLD:
+                continue
+            confidence = min(100, len(markers) * 40)
+            detected_platforms.append({
+                'platform': platform,
+                'confidence': confidence,
+                'reliability': 'high' if confidence >= 70 else 'medium' if confidence >= 40 else 'low'
+            })
+        return finalize_detections(detected_platforms, header_scores)
+
+    raw_hits = scan_raw_signatures(response.content)
+
+    # Hand the parser raw bytes: bs4/lxml pick up the declared charset
+    # themselves, so the header-guessed decode in fetch_website is never a
+    # parsing input and no second full-body decode happens here.
+    soup = BeautifulSoup(response.content, HTML_PARSER, parse_only=STRAINER)
+
+    # Bucket the relevant elements in one walk; each signature check then
+    # scans its own small bucket instead of re-walking the whole tree.
+    elements_by_tag = {}
+    for element in soup.find_all(SIGNATURE_TAGS):
+        elements_by_tag.setdefault(element.name, []).append(element)
+
+    # The strained tree has no <html> element, so parse just its opening tag
+    # for the html-level checks (e.g. Webflow's w-mod-js class).
+    html_tag = HTML_TAG_RE.search(response.content)
+    if html_tag:
+        html_element = BeautifulSoup(html_tag.group(), HTML_PARSER).html
+        if html_element is not None:
+            elements_by_tag['html'] = [html_element]
+
+    # A generator meta tag that names a known platform settles the question;
+    # return before running the signature sweep.
+    for element in elements_by_tag.get('meta', ()):
+        if element.get('name') == 'generator':
+            generator = (element.get('content') or '').lower()
+            for keyword, platform in GENERATOR_PLATFORMS.items():
+                if keyword in generator:
+                    return finalize_detections([{
+                        'platform': platform,
+                        'confidence': 100,
+                        'reliability': 'high'
+                    }], header_scores)
+
+    combined_hits = count_combined_attr_hits(elements_by_tag)
+
+    detected_platforms = []
+    header_platforms = {p.lower() for p in header_scores}
+
+    signatures = get_platform_signatures()
+    for platform, checks in signatures.items():
+        # The raw scan is a superset of the substring-based signatures,
+        # so a platform with no raw hits cannot match below (structural
+        # checks excepted). Header/cookie hints keep a platform in play
+        # regardless.
+        if (platform not in STRUCTURAL_PLATFORMS
+                and not raw_hits.get(platform)
+                and platform not in header_scores):
+            continue
+
+        matches = 0
+        total_checks = len(checks)
         
-        signatures = get_platform_signatures()
-        for platform, checks in signatures.items():
-            matches = 0
-            total_checks = len(checks)
-            
-            for tag, attrs in checks:
-                elements = soup.find_all(tag, attrs)
-                if elements:
-                    matches += 1
-                    if len(elements) > 1:
-                        matches += 0.5
+        for tag, attrs in checks:
+            attr = next(iter(attrs)) if len(attrs) == 1 else None
+            if (attr and (tag, attr) in COMBINED_ATTR_PATTERNS
+                    and hasattr(attrs[attr], 'search')):
+                matched = combined_hits.get((platform, tag, attr), 0)
+            else:
+                matched = 0
+                for element in elements_by_tag.get(tag, ()):
+                    if element_matches(element, attrs):
+                        matched += 1
+                        # Scoring only distinguishes 0, 1 and >1 matches,
+                        # so stop scanning the bucket after the second hit.
+                        if matched > 1:
+                            break
+            if matched:
+                matches += 1
+                if matched > 1:
+                    matches += 0.5
+                # Once matches reaches total_checks the confidence is
+                # already capped at 100, so the remaining checks cannot
+                # change this platform's score.
+                if matches >= total_checks:
+                    break
+
+        if matches > 0:
+            header_bonus = 1 if platform.lower() in header_platforms else 0
+            confidence = get_confidence_score(matches, total_checks, header_bonus)
             
-            if matches > 0:
-                header_bonus = 1 if platform.lower() in str(header_scores).lower() else 0
-                confidence = get_confidence_score(matches, total_checks, header_bonus)
-                
-                detected_platforms.append({
-                    'platform': platform,
-                    'confidence': round(confidence, 1),
-                    'reliability': 'high' if confidence >= 70 else 'medium' if confidence >= 40 else 'low'
-                })
-        
-        # Add header-only detections
-        for platform, confidence in header_scores.items():
-            if not any(p['platform'] == platform for p in detected_platforms):
-                detected_platforms.append({
-                    'platform': platform,
-                    'confidence': confidence,
-                    'reliability': 'high'
-                })
-        
-        detected_platforms.sort(key=lambda x: x['confidence'], reverse=True)
-        
-        return detected_platforms if detected_platforms else [{
-            'platform': 'No platform detected',
-            'confidence': 0,
-            'reliability': 'none'
-        }]
-        
+            detected_platforms.append({
+                'platform': platform,
+                'confidence': round(confidence, 1),
+                'reliability': 'high' if confidence >= 70 else 'medium' if confidence >= 40 else 'low'
+            })
+    
+    return finalize_detections(detected_platforms, header_scores)
+
+def finalize_detections(detected_platforms, header_scores):
+    """Merge header-only detections, rank, and apply the empty fallback."""
+    seen = {p['platform'] for p in detected_platforms}
+    for platform, confidence in header_scores.items():
+        if platform not in seen:
+            seen.add(platform)
+            detected_platforms.append({
+                'platform': platform,
+                'confidence': confidence,
+                'reliability': 'high'
+            })
+
+    detected_platforms.sort(key=itemgetter('confidence'), reverse=True)
+
+    return detected_platforms if detected_platforms else [{
+        'platform': 'No platform detected',
+        'confidence': 0,
+        'reliability': 'none'
+    }]
+
+def detect_platform(url):
+    """Detect the platform/framework used by a website."""
+    try:
+        return analyze_website(url)
     except requests.exceptions.ConnectionError:
         logger.error(f"Connection error for URL: {url}")
         return [{'platform': 'Could not connect to website. Please check the URL and try again.', 'confidence': 0, 'reliability': 'error'}]
@@ -221,34 +584,52 @@ def detect_platform(url):
         logger.error(f"Request error for URL {url}: {str(e)}")
         return [{'platform': f'An error occurred while analyzing the website: {str(e)}', 'confidence': 0, 'reliability': 'error'}]
 
+def detect_platforms(urls):
+    """Detect platforms for several URLs concurrently.
+
+    The batch is network-bound, so a small thread pool turns the total wall
+    time from the sum of per-site latencies into roughly the slowest one,
+    while every worker shares the pooled session.
+    """
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        results = list(executor.map(detect_platform, urls))
+    return dict(zip(urls, results))
+
 # Streamlit UI
 st.set_page_config(page_title='Website Platform Detector', layout='wide')
 
 st.title('Website Platform Detector')
-st.write('Enter a website URL to detect its platform.')
+st.write('Enter one or more website URLs (comma or space separated) to detect their platforms.')
 
-url = st.text_input('Website URL', placeholder='example.com')
+url = st.text_input('Website URL', placeholder='example.com, another.com')
 
 if url:
-    cleaned_url = clean_url(url)
-    
-    if cleaned_url:
+    entered_urls = [u for u in re.split(r'[,\s]+', url) if u]
+    cleaned_urls = [clean_url(u) for u in entered_urls]
+
+    if cleaned_urls and all(cleaned_urls):
         with st.spinner('Analyzing...'):
             try:
-                platforms = detect_platform(cleaned_url)
-                
-                for platform in platforms:
-                    if platform['reliability'] == 'error':
-                        st.error(platform['platform'])
-                    elif platform['platform'] != 'No platform detected':
-                        if platform['reliability'] == 'high':
-                            st.success(f"{platform['platform']}: {platform['confidence']}%")
-                        elif platform['reliability'] == 'medium':
-                            st.info(f"{platform['platform']}: {platform['confidence']}%")
+                results = detect_platforms(cleaned_urls)
+
+                for cleaned_url, platforms in results.items():
+                    if len(results) > 1:
+                        st.subheader(cleaned_url)
+
+                    for platform in platforms:
+                        if platform['reliability'] == 'error':
+                            st.error(platform['platform'])
+                        elif platform['platform'] != 'No platform detected':
+                            if platform['reliability'] == 'high':
+                                st.success(f"{platform['platform']}: {platform['confidence']}%")
+                            elif platform['reliability'] == 'medium':
+                                st.info(f"{platform['platform']}: {platform['confidence']}%")
+                            else:
+                                st.warning(f"{platform['platform']}: {platform['confidence']}%")
                         else:
-                            st.warning(f"{platform['platform']}: {platform['confidence']}%")
-                    else:
-                        st.warning('No platforms detected with confidence')
+                            st.warning('No platforms detected with confidence')
                         
             except Exception as e:
                 logger.exception("Unexpected error")